@@ -5,9 +5,15 @@ using argparse.
 """
 
 import argparse
+import importlib.util
 import logging
+import os
+import re
 import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import TypeVar
 
 from chaptersaw import __version__
 from chaptersaw.exceptions import (
@@ -17,25 +23,23 @@ from chaptersaw.exceptions import (
 )
 from chaptersaw.extractor import (
     ChapterExtractor,
+    compile_pattern,
     resolve_input_files,
+    resolve_input_files_many,
 )
+from chaptersaw.models import Track
 
-# Try to import rich for progress bar support
-try:
-    from rich.console import Console
-    from rich.progress import (
-        BarColumn,
-        Progress,
-        SpinnerColumn,
-        TaskProgressColumn,
-        TextColumn,
-        TimeElapsedColumn,
-    )
-    from rich.table import Table
+# rich is imported lazily where tables and progress bars are rendered, so
+# modes such as --version and --parse-filename don't pay for the import
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+
+T = TypeVar("T")
+
+# Upper bound on concurrent ffprobe processes when listing files
+MAX_PROBE_WORKERS = 32
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# Upper bound on threads expanding input glob patterns concurrently
+MAX_GLOB_WORKERS = 8
 
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
@@ -260,16 +264,68 @@ def print_progress(file: str, current: int, total: int) -> None:
     print(f"[{current}/{total}] Processing: {file}")
 
 
+def probe_in_order(
+    probe: Callable[[Path], T], input_files: list[Path]
+) -> Iterator[tuple[Path, Future[T]]]:
+    """Run a probe function over input files concurrently.
+
+    Each probe spawns its own ffprobe process, so probing in a thread pool
+    overlaps process startup and disk latency across files.
+
+    Args:
+        probe: Function to call for each input file.
+        input_files: Files to probe.
+
+    Yields:
+        (input_file, future) pairs in the original input order.
+    """
+    workers = max(1, min(MAX_PROBE_WORKERS, len(input_files)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(probe, f) for f in input_files]
+        yield from zip(input_files, futures, strict=True)
+
+
+def resolve_inputs(patterns: list[str]) -> list[Path]:
+    """Resolve all input patterns, expanding globs concurrently.
+
+    Directory enumeration dominates on network shares or cold caches, so
+    each directory is listed once and the listings run in a thread pool.
+
+    Args:
+        patterns: Input file paths or glob patterns.
+
+    Returns:
+        Resolved files without duplicates, grouped in the order the patterns
+        were given.
+
+    Raises:
+        FileNotFoundError: If any pattern matches no files.
+    """
+    if len(patterns) <= 1:
+        files: Iterable[Path] = (f for p in patterns for f in resolve_input_files(p))
+    else:
+        files = resolve_input_files_many(
+            patterns, max_workers=min(MAX_GLOB_WORKERS, len(patterns))
+        )
+
+    # Drop duplicates while preserving first-seen order, keyed on the path
+    # string (cheaper to hash than Path objects for large glob expansions)
+    return list({os.fspath(f): f for f in files}.values())
+
+
 def list_chapters(
     extractor: ChapterExtractor, input_files: list[Path], use_rich: bool = True
 ) -> None:
     """List all chapters in the input files."""
     if use_rich and RICH_AVAILABLE:
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
-        for input_file in input_files:
+        for input_file, future in probe_in_order(extractor.get_chapters, input_files):
             try:
-                chapters = extractor.get_chapters(input_file)
+                chapters = future.result()
 
                 table = Table(title=f"Chapters in {input_file.name}")
                 table.add_column("#", style="cyan", justify="right")
@@ -293,12 +349,12 @@ def list_chapters(
             except ChapterExtractionError as e:
                 console.print(f"[red]Error reading {input_file}: {e}[/red]")
     else:
-        for input_file in input_files:
+        for input_file, future in probe_in_order(extractor.get_chapters, input_files):
             print(f"\nChapters in {input_file.name}:")
             print("-" * 60)
 
             try:
-                chapters = extractor.get_chapters(input_file)
+                chapters = future.result()
 
                 if not chapters:
                     print("  No chapters found")
@@ -315,16 +371,38 @@ def list_chapters(
                 print(f"  Error: {e}")
 
 
+def format_track_details(track: Track) -> str:
+    """Format a track's resolution, channels, and sample rate, comma-separated."""
+    parts = (
+        f"{track.width}x{track.height}" if track.width and track.height else "",
+        f"{track.channels}ch" if track.channels else "",
+        f"{track.sample_rate}Hz" if track.sample_rate else "",
+    )
+    return ", ".join(part for part in parts if part)
+
+
+def format_track_flags(track: Track) -> str:
+    """Format a track's default/forced flags, comma-separated."""
+    parts = (
+        "default" if track.default else "",
+        "forced" if track.forced else "",
+    )
+    return ", ".join(part for part in parts if part)
+
+
 def list_tracks(
     extractor: ChapterExtractor, input_files: list[Path], use_rich: bool = True
 ) -> None:
     """List all tracks in the input files."""
     if use_rich and RICH_AVAILABLE:
+        from rich.console import Console
+        from rich.table import Table
+
         console = Console()
 
-        for input_file in input_files:
+        for input_file, future in probe_in_order(extractor.get_tracks, input_files):
             try:
-                tracks = extractor.get_tracks(input_file)
+                tracks = future.result()
 
                 table = Table(title=f"Tracks in {input_file.name}")
                 table.add_column("ID", style="cyan", justify="right")
@@ -336,30 +414,14 @@ def list_tracks(
                 table.add_column("Flags", style="red")
 
                 for track in tracks:
-                    # Build details string
-                    details = []
-                    if track.width and track.height:
-                        details.append(f"{track.width}x{track.height}")
-                    if track.channels:
-                        details.append(f"{track.channels}ch")
-                    if track.sample_rate:
-                        details.append(f"{track.sample_rate}Hz")
-
-                    # Build flags string
-                    flags = []
-                    if track.default:
-                        flags.append("default")
-                    if track.forced:
-                        flags.append("forced")
-
                     table.add_row(
                         str(track.id),
                         track.type,
                         track.codec,
                         track.language or "-",
                         track.name or "-",
-                        ", ".join(details) if details else "-",
-                        ", ".join(flags) if flags else "-",
+                        format_track_details(track) or "-",
+                        format_track_flags(track) or "-",
                     )
 
                 console.print(table)
@@ -368,38 +430,25 @@ def list_tracks(
             except ChapterExtractionError as e:
                 console.print(f"[red]Error reading {input_file}: {e}[/red]")
     else:
-        for input_file in input_files:
+        for input_file, future in probe_in_order(extractor.get_tracks, input_files):
             print(f"\nTracks in {input_file.name}:")
             print("-" * 80)
 
             try:
-                tracks = extractor.get_tracks(input_file)
+                tracks = future.result()
 
                 if not tracks:
                     print("  No tracks found")
                     continue
 
                 for track in tracks:
-                    # Build details string
-                    details = []
-                    if track.width and track.height:
-                        details.append(f"{track.width}x{track.height}")
-                    if track.channels:
-                        details.append(f"{track.channels}ch")
-                    if track.sample_rate:
-                        details.append(f"{track.sample_rate}Hz")
-
-                    # Build flags string
-                    flags = []
-                    if track.default:
-                        flags.append("default")
-                    if track.forced:
-                        flags.append("forced")
+                    details = format_track_details(track)
+                    flags = format_track_flags(track)
 
                     lang = f"[{track.language}]" if track.language else ""
                     name = f'"{track.name}"' if track.name else ""
-                    detail_str = f"({', '.join(details)})" if details else ""
-                    flag_str = f"[{', '.join(flags)}]" if flags else ""
+                    detail_str = f"({details})" if details else ""
+                    flag_str = f"[{flags}]" if flags else ""
 
                     print(
                         f"  {track.id:3d}. {track.type:<10} {track.codec:<12} "
@@ -414,19 +463,24 @@ def run_dry_run(
     extractor: ChapterExtractor,
     input_files: list[Path],
     keyword: str | None,
-    pattern: str | None,
+    pattern: str | re.Pattern[str] | None,
     case_sensitive: bool,
     exclude: bool,
 ) -> None:
     """Execute a dry run showing what would be extracted."""
     print("\n=== DRY RUN ===\n")
 
-    filter_desc = pattern if pattern else keyword
+    # String patterns are compiled per file through the cached compiler, so
+    # an invalid pattern is still reported as a per-file error here
+    filter_desc = (
+        pattern.pattern if isinstance(pattern, re.Pattern) else pattern or keyword
+    )
     mode = "Excluding" if exclude else "Matching"
 
     total_matched = 0
     for input_file in input_files:
-        print(f"File: {input_file}")
+        # Collect each file's report and write it with a single print call
+        lines = [f"File: {input_file}"]
         try:
             chapters = extractor.get_chapters(input_file)
 
@@ -439,25 +493,106 @@ def run_dry_run(
                     chapters, keyword or "", case_sensitive, exclude
                 )
 
-            print(f"  Total chapters: {len(chapters)}")
-            print(f"  {mode} '{filter_desc}': {len(matching)}")
-
-            for chapter in matching:
-                print(f"    - {chapter}")
+            lines.append(f"  Total chapters: {len(chapters)}")
+            lines.append(f"  {mode} '{filter_desc}': {len(matching)}")
+            lines.extend(f"    - {chapter}" for chapter in matching)
 
             total_matched += len(matching)
         except Exception as e:
-            print(f"  Error: {e}")
-        print()
+            lines.append(f"  Error: {e}")
+        print("\n".join(lines), end="\n\n")
 
     print(f"Total chapters to extract: {total_matched}")
 
 
+def parse_filenames(patterns: list[str]) -> None:
+    """Print the media info detected in each filename."""
+    from chaptersaw.parser import parse_filename
+
+    for input_pattern in patterns:
+        info = parse_filename(input_pattern)
+        print(f"\n{input_pattern}:")
+        print(f"  Title: {info.title or '(not detected)'}")
+        if info.season is not None:
+            print(f"  Season: {info.season}")
+        if info.episode is not None:
+            print(f"  Episode: {info.episode}")
+        if info.episode_count and info.episode_count > 1:
+            print(f"  Episode Count: {info.episode_count}")
+        if info.year:
+            print(f"  Year: {info.year}")
+        if info.resolution:
+            print(f"  Resolution: {info.resolution}")
+        if info.source:
+            print(f"  Source: {info.source}")
+        if info.release_group:
+            print(f"  Release Group: {info.release_group}")
+
+
+def set_default_tracks(
+    extractor: ChapterExtractor,
+    input_files: list[Path],
+    audio: str | None,
+    subtitle: str | None,
+    track_id: int | None,
+    quiet: bool,
+) -> bool:
+    """Set default tracks in each input file.
+
+    Returns:
+        True if every file was updated without errors.
+    """
+    logger = logging.getLogger(__name__)
+    all_success = True
+
+    for input_file in input_files:
+        try:
+            if track_id is not None:
+                # Set specific track by ID
+                extractor.set_default_track(input_file, track_id=track_id)
+                if not quiet:
+                    print(f"{input_file.name}: Set track {track_id} as default")
+            else:
+                # Set by language
+                track_result = extractor.set_default_tracks_by_language(
+                    input_file,
+                    audio_language=audio,
+                    subtitle_language=subtitle,
+                )
+                if not quiet:
+                    changes = []
+                    if track_result["audio"]:
+                        changes.append(f"audio={audio}")
+                    if track_result["subtitle"]:
+                        changes.append(f"subtitle={subtitle}")
+                    if changes:
+                        print(f"{input_file.name}: Set default {', '.join(changes)}")
+                    else:
+                        print(f"{input_file.name}: No matching tracks found")
+        except UnsupportedFormatError as e:
+            logger.error(f"{input_file.name}: {e}")
+            all_success = False
+        except ChapterExtractionError as e:
+            logger.error(f"{input_file.name}: {e}")
+            all_success = False
+
+    return all_success
+
+
 class RichProgressCallback:
     """Progress callback using rich library."""
 
     def __init__(self, total: int, description: str = "Processing") -> None:
         """Initialize the progress callback."""
+        from rich.progress import (
+            BarColumn,
+            Progress,
+            SpinnerColumn,
+            TaskProgressColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
         self.progress = Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -466,10 +601,16 @@ class RichProgressCallback:
             TimeElapsedColumn(),
         )
         self.task_id = self.progress.add_task(description, total=total)
+        self._last_file: str | None = None
         self.progress.start()
 
     def __call__(self, file: str, current: int, total: int) -> None:
-        """Update progress."""
+        """Update progress, rebuilding the description only when it changes."""
+        if file == self._last_file:
+            self.progress.update(self.task_id, completed=current)
+            return
+
+        self._last_file = file
         self.progress.update(
             self.task_id, completed=current, description=f"Processing: {file[:50]}"
         )
@@ -488,6 +629,12 @@ def main(argv: list[str] | None = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors).
     """
+    # Answer a bare version query without building the full parser
+    args_list = sys.argv[1:] if argv is None else argv
+    if len(args_list) == 1 and args_list[0] in ("-V", "--version"):
+        print(f"chaptersaw {__version__}")
+        return 0
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
@@ -522,49 +669,27 @@ def main(argv: list[str] | None = None) -> int:
     if needs_filter and not args.output and not args.separate:
         parser.error("Either -o/--output or -s/--separate is required for extraction")
 
+    # Compile the regex once up front so every input file reuses it
+    regex: re.Pattern[str] | None = None
+    if needs_filter and args.regex:
+        try:
+            regex = compile_pattern(args.regex, args.case_sensitive)
+        except re.error as e:
+            parser.error(f"Invalid regex pattern '{args.regex}': {e}")
+
     # Parse filename mode doesn't require files to exist
     if args.parse_filename:
-        from chaptersaw.parser import parse_filename
-
-        for input_pattern in args.inputs:
-            info = parse_filename(input_pattern)
-            print(f"\n{input_pattern}:")
-            print(f"  Title: {info.title or '(not detected)'}")
-            if info.season is not None:
-                print(f"  Season: {info.season}")
-            if info.episode is not None:
-                print(f"  Episode: {info.episode}")
-            if info.episode_count and info.episode_count > 1:
-                print(f"  Episode Count: {info.episode_count}")
-            if info.year:
-                print(f"  Year: {info.year}")
-            if info.resolution:
-                print(f"  Resolution: {info.resolution}")
-            if info.source:
-                print(f"  Source: {info.source}")
-            if info.release_group:
-                print(f"  Release Group: {info.release_group}")
+        parse_filenames(args.inputs)
         return 0
 
     # Resolve input files
     try:
-        input_files: list[Path] = []
-        for input_pattern in args.inputs:
-            input_files.extend(resolve_input_files(input_pattern))
+        input_files = resolve_inputs(args.inputs)
 
         if not input_files:
             logger.error("No input files found")
             return 1
 
-        # Remove duplicates while preserving order
-        seen: set[Path] = set()
-        unique_files: list[Path] = []
-        for f in input_files:
-            if f not in seen:
-                seen.add(f)
-                unique_files.append(f)
-        input_files = unique_files
-
         logger.info(f"Found {len(input_files)} input file(s)")
 
     except FileNotFoundError as e:
@@ -592,38 +717,14 @@ def main(argv: list[str] | None = None) -> int:
 
     # Set default tracks mode
     if args.set_default:
-        all_success = True
-        for input_file in input_files:
-            try:
-                if args.track_id is not None:
-                    # Set specific track by ID
-                    extractor.set_default_track(input_file, track_id=args.track_id)
-                    if not args.quiet:
-                        print(f"{input_file.name}: Set track {args.track_id} as default")  # noqa: E501
-                else:
-                    # Set by language
-                    track_result = extractor.set_default_tracks_by_language(
-                        input_file,
-                        audio_language=args.audio,
-                        subtitle_language=args.subtitle,
-                    )
-                    if not args.quiet:
-                        changes = []
-                        if track_result["audio"]:
-                            changes.append(f"audio={args.audio}")
-                        if track_result["subtitle"]:
-                            changes.append(f"subtitle={args.subtitle}")
-                        if changes:
-                            msg = f"{input_file.name}: Set default {', '.join(changes)}"
-                            print(msg)
-                        else:
-                            print(f"{input_file.name}: No matching tracks found")
-            except UnsupportedFormatError as e:
-                logger.error(f"{input_file.name}: {e}")
-                all_success = False
-            except ChapterExtractionError as e:
-                logger.error(f"{input_file.name}: {e}")
-                all_success = False
+        all_success = set_default_tracks(
+            extractor,
+            input_files,
+            audio=args.audio,
+            subtitle=args.subtitle,
+            track_id=args.track_id,
+            quiet=args.quiet,
+        )
         return 0 if all_success else 1
 
     # Dry run mode
@@ -632,7 +733,7 @@ def main(argv: list[str] | None = None) -> int:
             extractor,
             input_files,
             args.keyword,
-            args.regex,
+            regex,
             args.case_sensitive,
             args.exclude,
         )
@@ -645,8 +746,6 @@ def main(argv: list[str] | None = None) -> int:
             RICH_AVAILABLE and not args.no_progress and not args.quiet
         )
 
-        from collections.abc import Callable
-
         progress_callback: Callable[[str, int, int], None] | None = None
         rich_progress: RichProgressCallback | None = None
 
@@ -663,19 +762,21 @@ def main(argv: list[str] | None = None) -> int:
             results = extractor.extract_to_separate_files(
                 input_files,
                 keyword=args.keyword,
-                pattern=args.regex,
+                pattern=regex,
                 output_dir=args.output_dir,
                 case_sensitive=args.case_sensitive,
                 exclude=args.exclude,
                 output_suffix=args.suffix,
                 on_progress=progress_callback,
+                parallel=args.parallel,
+                max_workers=args.workers,
             )
         else:
             results = extractor.extract_and_merge(
                 input_files,
                 output_file=args.output,
                 keyword=args.keyword,
-                pattern=args.regex,
+                pattern=regex,
                 case_sensitive=args.case_sensitive,
                 exclude=args.exclude,
                 on_progress=progress_callback,
@@ -692,22 +793,28 @@ def main(argv: list[str] | None = None) -> int:
         if not args.quiet:
             print("\n=== Summary ===")
             total_extracted = 0
-            failed = 0
+            success_lines: list[str] = []
+            failure_lines: list[str] = []
 
             for result in results:
                 if result.success:
                     total_extracted += len(result.chapters_extracted)
                     if result.chapters_extracted:
-                        logger.info(f"  {result}")
+                        success_lines.append(f"  {result}")
                 else:
-                    failed += 1
-                    logger.error(
+                    failure_lines.append(
                         f"  FAILED: {result.source_file} - {result.error_message}"
                     )
 
+            # Emit each group as one log record rather than one per file
+            if success_lines:
+                logger.info("\n".join(success_lines))
+            if failure_lines:
+                logger.error("\n".join(failure_lines))
+
             print(f"\nTotal chapters extracted: {total_extracted}")
-            if failed:
-                print(f"Failed files: {failed}")
+            if failure_lines:
+                print(f"Failed files: {len(failure_lines)}")
 
             if args.separate:
                 output_files = [r.output_file for r in results if r.output_file]
@@ -6,13 +6,18 @@ for extracting chapters from video files.
 
 import json
 import logging
+import os
 import re
+import shutil
 import subprocess
 import tempfile
 from collections.abc import Callable, Sequence
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from fnmatch import fnmatch
+from functools import cache, lru_cache
 from glob import glob
 from pathlib import Path
+from typing import Any
 
 from chaptersaw.exceptions import (
     ChapterExtractionError,
@@ -23,6 +28,13 @@ from chaptersaw.models import Chapter, ExtractionResult, Track
 
 logger = logging.getLogger(__name__)
 
+# Characters that make a path component a glob pattern
+_GLOB_MAGIC = re.compile(r"[*?[]")
+
+# ffmpeg options that limit stderr to actual errors (only read on failure)
+# and stop ffmpeg from reading the terminal's stdin
+_FFMPEG_QUIET_ARGS = ("-hide_banner", "-nostdin", "-loglevel", "error")
+
 # Supported video container formats
 SUPPORTED_FORMATS: frozenset[str] = frozenset({
     ".mkv",   # Matroska
@@ -35,6 +47,57 @@ SUPPORTED_FORMATS: frozenset[str] = frozenset({
 })
 
 
+def _probe_key(path: Path) -> tuple[str, int, int]:
+    """Return a cache key that changes whenever the file is modified.
+
+    A single stat call doubles as the existence check.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def compile_pattern(pattern: str, case_sensitive: bool = False) -> re.Pattern[str]:
+    """Compile a chapter-title regex pattern, caching the result.
+
+    Args:
+        pattern: Regular expression pattern to compile.
+        case_sensitive: Whether the pattern should be case-sensitive.
+            Defaults to False.
+
+    Returns:
+        The compiled pattern. Repeated calls with the same arguments return
+        the same object, so per-file filtering never re-parses the pattern.
+
+    Raises:
+        re.error: If the regex pattern is invalid.
+    """
+    return re.compile(pattern, 0 if case_sensitive else re.IGNORECASE)
+
+
+@cache
+def _validate_executables(ffprobe_path: Path, ffmpeg_path: Path) -> None:
+    """Check that ffprobe and ffmpeg can be found.
+
+    Executables are looked up on PATH (or checked directly when given as a
+    path) rather than run, so creating an extractor spawns no processes.
+    Successful checks are cached per path pair; failures raise and are not
+    cached, so installing FFmpeg later in the same process is picked up.
+
+    Raises:
+        FFmpegNotFoundError: If either executable cannot be found.
+    """
+    for tool, path in [("ffprobe", ffprobe_path), ("ffmpeg", ffmpeg_path)]:
+        if shutil.which(path) is None:
+            raise FFmpegNotFoundError(
+                f"{tool} not found at '{path}'. Please install FFmpeg and ensure "
+                "it's in your PATH, or provide the full path to the executable."
+            )
+
+
 class ChapterExtractor:
     """Extract and merge chapters from video files.
 
@@ -84,25 +147,15 @@ class ChapterExtractor:
         self.mkvpropedit_path = Path(mkvpropedit_path)
         self._temp_dir = temp_dir
         self._mkvpropedit_available: bool | None = None
+        # ffprobe results keyed by _probe_key(), so re-probing an unchanged
+        # file within one session doesn't spawn another process
+        self._chapter_cache: dict[tuple[str, int, int], list[Chapter]] = {}
+        self._track_cache: dict[tuple[str, int, int], list[Track]] = {}
         self._validate_dependencies()
 
     def _validate_dependencies(self) -> None:
         """Validate that ffmpeg and ffprobe are available."""
-        for tool, path in [
-            ("ffprobe", self.ffprobe_path),
-            ("ffmpeg", self.ffmpeg_path),
-        ]:
-            try:
-                subprocess.run(
-                    [str(path), "-version"],
-                    capture_output=True,
-                    check=True,
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError) as e:
-                raise FFmpegNotFoundError(
-                    f"{tool} not found at '{path}'. Please install FFmpeg and ensure "
-                    "it's in your PATH, or provide the full path to the executable."
-                ) from e
+        _validate_executables(self.ffprobe_path, self.ffmpeg_path)
 
     def get_chapters(self, input_file: str | Path) -> list[Chapter]:
         """Extract chapter information from an MKV file.
@@ -117,47 +170,11 @@ class ChapterExtractor:
             ChapterExtractionError: If chapter extraction fails.
         """
         input_path = Path(input_file)
-
-        if not input_path.exists():
-            raise ChapterExtractionError(f"Input file not found: {input_path}")
-
-        cmd = [
-            str(self.ffprobe_path),
-            "-i",
-            str(input_path),
-            "-print_format",
-            "json",
-            "-show_chapters",
-            "-loglevel",
-            "error",
-        ]
-
-        try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            data = json.loads(result.stdout)
-        except subprocess.CalledProcessError as e:
-            raise ChapterExtractionError(
-                f"Failed to probe file '{input_path}': {e.stderr}"
-            ) from e
-        except json.JSONDecodeError as e:
-            raise ChapterExtractionError(
-                f"Failed to parse chapter data from '{input_path}'"
-            ) from e
-
-        chapters = []
-        for idx, chapter_data in enumerate(data.get("chapters", [])):
-            tags = chapter_data.get("tags", {})
-            title = tags.get("title", f"Chapter {idx + 1}")
-            chapters.append(
-                Chapter(
-                    title=title,
-                    start_time=float(chapter_data["start_time"]),
-                    end_time=float(chapter_data["end_time"]),
-                    index=idx,
-                )
-            )
-
-        return chapters
+        cache_key = self._cache_key(input_path)
+        chapters = self._chapter_cache.get(cache_key)
+        if chapters is None:
+            chapters, _ = self._probe(input_path, cache_key)
+        return list(chapters)
 
     def get_tracks(self, input_file: str | Path) -> list[Track]:
         """Extract track information from a video file.
@@ -172,90 +189,89 @@ class ChapterExtractor:
             ChapterExtractionError: If track extraction fails.
         """
         input_path = Path(input_file)
+        cache_key = self._cache_key(input_path)
+        tracks = self._track_cache.get(cache_key)
+        if tracks is None:
+            _, tracks = self._probe(input_path, cache_key)
+        return list(tracks)
 
-        if not input_path.exists():
-            raise ChapterExtractionError(f"Input file not found: {input_path}")
+    def _cache_key(self, input_path: Path) -> tuple[str, int, int]:
+        """Return the probe cache key for a file.
+
+        Raises:
+            ChapterExtractionError: If the file does not exist.
+        """
+        try:
+            return _probe_key(input_path)
+        except FileNotFoundError as e:
+            raise ChapterExtractionError(f"Input file not found: {input_path}") from e
+
+    def _probe(
+        self, input_path: Path, cache_key: tuple[str, int, int]
+    ) -> tuple[list[Chapter], list[Track]]:
+        """Run ffprobe once for both chapters and streams and cache the results.
+
+        Asking for both costs one process instead of two, so whichever of
+        get_chapters() or get_tracks() runs first also answers the other.
 
+        Args:
+            input_path: Path to the video file.
+            cache_key: Key from _probe_key() for the file.
+
+        Returns:
+            Tuple of (chapters, tracks).
+
+        Raises:
+            ChapterExtractionError: If probing or parsing fails.
+        """
         cmd = [
             str(self.ffprobe_path),
             "-i",
             str(input_path),
             "-print_format",
             "json",
+            "-show_chapters",
             "-show_streams",
             "-loglevel",
             "error",
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, capture_output=True, check=True)
             data = json.loads(result.stdout)
         except subprocess.CalledProcessError as e:
             raise ChapterExtractionError(
-                f"Failed to probe file '{input_path}': {e.stderr}"
+                f"Failed to probe file '{input_path}': {_stderr_text(e)}"
             ) from e
         except json.JSONDecodeError as e:
             raise ChapterExtractionError(
-                f"Failed to parse track data from '{input_path}'"
+                f"Failed to parse probe data from '{input_path}'"
             ) from e
 
-        tracks = []
-        for stream in data.get("streams", []):
-            codec_type = stream.get("codec_type", "unknown")
-
-            # Map ffprobe codec_type to our track type
-            if codec_type == "video":
-                track_type = "video"
-            elif codec_type == "audio":
-                track_type = "audio"
-            elif codec_type == "subtitle":
-                track_type = "subtitles"
-            else:
-                track_type = codec_type
-
-            # Get language from tags
-            tags = stream.get("tags", {})
-            language = tags.get("language")
-            name = tags.get("title")
-
-            # Get disposition flags
-            disposition = stream.get("disposition", {})
-            is_default = disposition.get("default", 0) == 1
-            is_forced = disposition.get("forced", 0) == 1
-
-            track = Track(
-                id=stream.get("index", 0),
-                type=track_type,
-                codec=stream.get("codec_name", "unknown"),
-                language=language,
-                name=name,
-                default=is_default,
-                forced=is_forced,
-                channels=stream.get("channels") if codec_type == "audio" else None,
-                sample_rate=(
-                    int(stream.get("sample_rate"))
-                    if codec_type == "audio" and stream.get("sample_rate")
-                    else None
-                ),
-                width=stream.get("width") if codec_type == "video" else None,
-                height=stream.get("height") if codec_type == "video" else None,
-            )
-            tracks.append(track)
+        chapters = _parse_chapters(data)
+        tracks = _parse_tracks(data)
+        self._chapter_cache[cache_key] = chapters
+        self._track_cache[cache_key] = tracks
+        return chapters, tracks
+
+    def _forget_probes(self, input_path: Path) -> None:
+        """Drop cached probe results for a file that was edited in place.
 
-        return tracks
+        mkvpropedit often rewrites headers without changing the file size, and on
+        filesystems with coarse timestamps the mtime may not change either,
+        so the stat-based cache key alone can't be trusted after an edit.
+        """
+        path = os.path.abspath(input_path)
+        for probe_cache in (self._chapter_cache, self._track_cache):
+            for key in [k for k in probe_cache if k[0] == path]:
+                del probe_cache[key]
 
     def _is_mkvpropedit_available(self) -> bool:
-        """Check if mkvpropedit is available."""
+        """Check if mkvpropedit is available (looked up, not run)."""
         if self._mkvpropedit_available is None:
-            try:
-                subprocess.run(
-                    [str(self.mkvpropedit_path), "--version"],
-                    capture_output=True,
-                    check=True,
-                )
-                self._mkvpropedit_available = True
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                self._mkvpropedit_available = False
+            self._mkvpropedit_available = (
+                shutil.which(self.mkvpropedit_path) is not None
+            )
         return self._mkvpropedit_available
 
     def set_default_track(
@@ -289,19 +305,7 @@ class ChapterExtractor:
             ... )
         """
         input_path = Path(input_file)
-
-        if not input_path.exists():
-            raise ChapterExtractionError(f"Input file not found: {input_path}")
-
-        if input_path.suffix.lower() != ".mkv":
-            raise UnsupportedFormatError(
-                f"set_default_track only works with MKV files, got: {input_path.suffix}"
-            )
-
-        if not self._is_mkvpropedit_available():
-            raise ChapterExtractionError(
-                "mkvpropedit not found. Please install MKVToolNix to use this feature."
-            )
+        self._check_default_track_target(input_path)
 
         # If track_id is provided, use it directly
         if track_id is not None:
@@ -330,35 +334,9 @@ class ChapterExtractor:
                 "Either track_id or both track_type and language must be provided"
             )
 
-        # Get all tracks of the same type to clear their default flags
-        tracks = self.get_tracks(input_path)
-        same_type_tracks = [t for t in tracks if t.type == target_type]
-
-        # Build mkvpropedit command
-        # First, clear default flag on all tracks of same type
-        # Then set default on target track
-        cmd = [str(self.mkvpropedit_path), str(input_path)]
-
-        for track in same_type_tracks:
-            # mkvpropedit uses 1-based track numbers within each type
-            # But we need to use the actual track selector
-            cmd.extend([
-                "--edit", f"track:={track.id}",
-                "--set", "flag-default=0",
-            ])
-
-        # Set the target track as default
-        cmd.extend([
-            "--edit", f"track:={target_track_id}",
-            "--set", "flag-default=1",
-        ])
-
-        try:
-            subprocess.run(cmd, capture_output=True, check=True)
-        except subprocess.CalledProcessError as e:
-            raise ChapterExtractionError(
-                f"Failed to set default track: {e.stderr.decode()}"
-            ) from e
+        self._apply_default_tracks(
+            input_path, _default_track_args(tracks, target_type, target_track_id)
+        )
 
     def set_default_tracks_by_language(
         self,
@@ -389,45 +367,72 @@ class ChapterExtractor:
             {'audio': 1, 'subtitle': 3}
         """
         result: dict[str, int | None] = {"audio": None, "subtitle": None}
+        if not audio_language and not subtitle_language:
+            return result
 
-        if audio_language:
-            try:
-                self.set_default_track(
-                    input_file, track_type="audio", language=audio_language
-                )
-                tracks = self.get_tracks(input_file)
-                audio_track = next(
-                    (
-                        t for t in tracks
-                        if t.type == "audio" and t.language == audio_language
-                    ),
-                    None,
-                )
-                if audio_track:
-                    result["audio"] = audio_track.id
-            except ChapterExtractionError:
-                pass  # Track not found, continue
+        input_path = Path(input_file)
+        self._check_default_track_target(input_path)
+        tracks = self.get_tracks(input_path)
 
-        if subtitle_language:
-            try:
-                self.set_default_track(
-                    input_file, track_type="subtitles", language=subtitle_language
-                )
-                tracks = self.get_tracks(input_file)
-                sub_track = next(
-                    (
-                        t for t in tracks
-                        if t.type == "subtitles" and t.language == subtitle_language
-                    ),
-                    None,
-                )
-                if sub_track:
-                    result["subtitle"] = sub_track.id
-            except ChapterExtractionError:
-                pass  # Track not found, continue
+        # Collect both edits so mkvpropedit rewrites the file only once
+        edit_args: list[str] = []
+        for key, track_type, language in (
+            ("audio", "audio", audio_language),
+            ("subtitle", "subtitles", subtitle_language),
+        ):
+            if not language:
+                continue
+            target = next(
+                (t for t in tracks if t.type == track_type and t.language == language),
+                None,
+            )
+            if target is None:
+                continue  # Track not found, leave this type unchanged
+            edit_args.extend(_default_track_args(tracks, track_type, target.id))
+            result[key] = target.id
+
+        if edit_args:
+            self._apply_default_tracks(input_path, edit_args)
 
         return result
 
+    def _check_default_track_target(self, input_path: Path) -> None:
+        """Check that a file's default track flags can be edited.
+
+        Raises:
+            ChapterExtractionError: If the file or mkvpropedit is missing.
+            UnsupportedFormatError: If file is not MKV format.
+        """
+        if not input_path.exists():
+            raise ChapterExtractionError(f"Input file not found: {input_path}")
+
+        if input_path.suffix.lower() != ".mkv":
+            raise UnsupportedFormatError(
+                f"set_default_track only works with MKV files, got: {input_path.suffix}"
+            )
+
+        if not self._is_mkvpropedit_available():
+            raise ChapterExtractionError(
+                "mkvpropedit not found. Please install MKVToolNix to use this feature."
+            )
+
+    def _apply_default_tracks(self, input_path: Path, edit_args: list[str]) -> None:
+        """Run mkvpropedit once with the given --edit/--set arguments.
+
+        Raises:
+            ChapterExtractionError: If mkvpropedit fails.
+        """
+        cmd = [str(self.mkvpropedit_path), str(input_path), *edit_args]
+
+        try:
+            subprocess.run(cmd, capture_output=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise ChapterExtractionError(
+                f"Failed to set default track: {_stderr_text(e)}"
+            ) from e
+        finally:
+            self._forget_probes(input_path)
+
     def _get_duration(self, input_file: Path) -> float:
         """Get the duration of a video file in seconds.
 
@@ -452,7 +457,7 @@ class ChapterExtractor:
         ]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            result = subprocess.run(cmd, capture_output=True, check=True)
             data = json.loads(result.stdout)
             duration_str = data.get("format", {}).get("duration")
             if duration_str is None:
@@ -462,7 +467,7 @@ class ChapterExtractor:
             return float(duration_str)
         except subprocess.CalledProcessError as e:
             raise ChapterExtractionError(
-                f"Failed to probe file '{input_file}': {e.stderr}"
+                f"Failed to probe file '{input_file}': {_stderr_text(e)}"
             ) from e
         except (json.JSONDecodeError, KeyError) as e:
             raise ChapterExtractionError(
@@ -528,11 +533,12 @@ class ChapterExtractor:
             subprocess.run(cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
             raise ChapterExtractionError(
-                f"Failed to write chapters: {e.stderr.decode()}"
+                f"Failed to write chapters: {_stderr_text(e)}"
             ) from e
         finally:
             # Clean up temp file
             Path(chapter_file).unlink(missing_ok=True)
+            self._forget_probes(input_path)
 
     def _format_chapters_simple(self, chapters: list[Chapter]) -> str:
         """Format chapters in the simple chapter format for mkvpropedit.
@@ -654,20 +660,19 @@ class ChapterExtractor:
             exclude=True) the keyword.
         """
         if case_sensitive:
-            matches = [ch for ch in chapters if keyword in ch.title]
-        else:
-            matches = [ch for ch in chapters if keyword.lower() in ch.title.lower()]
+            if exclude:
+                return [ch for ch in chapters if keyword not in ch.title]
+            return [ch for ch in chapters if keyword in ch.title]
 
+        needle = keyword.lower()
         if exclude:
-            # Return chapters that are NOT in matches
-            matched_set = set(matches)
-            return [ch for ch in chapters if ch not in matched_set]
-        return matches
+            return [ch for ch in chapters if needle not in ch.title.lower()]
+        return [ch for ch in chapters if needle in ch.title.lower()]
 
     def filter_chapters_by_regex(
         self,
         chapters: list[Chapter],
-        pattern: str,
+        pattern: str | re.Pattern[str],
         case_sensitive: bool = False,
         exclude: bool = False,
     ) -> list[Chapter]:
@@ -675,9 +680,10 @@ class ChapterExtractor:
 
         Args:
             chapters: List of Chapter objects to filter.
-            pattern: Regular expression pattern to match against chapter titles.
+            pattern: Regular expression pattern to match against chapter titles,
+                either as a string or an already compiled pattern.
             case_sensitive: Whether the regex should be case-sensitive.
-                Defaults to False.
+                Defaults to False. Ignored if pattern is already compiled.
             exclude: If True, return chapters that do NOT match the pattern.
                 Defaults to False.
 
@@ -688,8 +694,10 @@ class ChapterExtractor:
         Raises:
             re.error: If the regex pattern is invalid.
         """
-        flags = 0 if case_sensitive else re.IGNORECASE
-        compiled = re.compile(pattern, flags)
+        if isinstance(pattern, re.Pattern):
+            compiled = pattern
+        else:
+            compiled = compile_pattern(pattern, case_sensitive)
 
         if exclude:
             return [ch for ch in chapters if not compiled.search(ch.title)]
@@ -736,6 +744,7 @@ class ChapterExtractor:
         """
         cmd = [
             str(self.ffmpeg_path),
+            *_FFMPEG_QUIET_ARGS,
             "-i",
             str(input_file),
             "-ss",
@@ -752,7 +761,7 @@ class ChapterExtractor:
             subprocess.run(cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
             raise ChapterExtractionError(
-                f"Failed to extract chapter '{chapter.title}': {e.stderr.decode()}"
+                f"Failed to extract chapter '{chapter.title}': {_stderr_text(e)}"
             ) from e
 
     def _merge_segments(
@@ -774,14 +783,17 @@ class ChapterExtractor:
         if not segment_files:
             raise ChapterExtractionError("No segments to merge")
 
+        # The concat demuxer resolves relative entries against the list file,
+        # so write absolute paths (abspath needs no per-segment syscalls)
         concat_file = temp_dir / "concat_list.txt"
-        with open(concat_file, "w", encoding="utf-8") as f:
-            for segment in segment_files:
-                abs_path = segment.resolve()
-                f.write(f"file '{abs_path}'\n")
+        concat_file.write_text(
+            "".join(f"file '{os.path.abspath(s)}'\n" for s in segment_files),
+            encoding="utf-8",
+        )
 
         cmd = [
             str(self.ffmpeg_path),
+            *_FFMPEG_QUIET_ARGS,
             "-f",
             "concat",
             "-safe",
@@ -798,14 +810,14 @@ class ChapterExtractor:
             subprocess.run(cmd, capture_output=True, check=True)
         except subprocess.CalledProcessError as e:
             raise ChapterExtractionError(
-                f"Failed to merge segments: {e.stderr.decode()}"
+                f"Failed to merge segments: {_stderr_text(e)}"
             ) from e
 
     def _filter_chapters(
         self,
         chapters: list[Chapter],
         keyword: str | None = None,
-        pattern: str | None = None,
+        pattern: str | re.Pattern[str] | None = None,
         case_sensitive: bool = False,
         exclude: bool = False,
     ) -> list[Chapter]:
@@ -840,7 +852,7 @@ class ChapterExtractor:
         input_files: Sequence[str | Path],
         output_file: str | Path,
         keyword: str | None = None,
-        pattern: str | None = None,
+        pattern: str | re.Pattern[str] | None = None,
         case_sensitive: bool = False,
         exclude: bool = False,
         on_progress: Callable[[str, int, int], None] | None = None,
@@ -856,15 +868,16 @@ class ChapterExtractor:
             output_file: Path for the merged output file.
             keyword: Keyword to filter chapters by title (mutually exclusive
                 with pattern).
-            pattern: Regex pattern to match chapter titles (mutually exclusive
-                with keyword).
+            pattern: Regex pattern to match chapter titles, as a string or
+                compiled pattern (mutually exclusive with keyword).
             case_sensitive: Whether keyword/pattern matching is case-sensitive.
             exclude: If True, extract chapters that do NOT match.
             on_progress: Optional callback for progress updates.
                 Called with (current_file, current_index, total_files).
-            parallel: If True, use parallel processing for extraction.
+            parallel: If True, probe input files and extract segments in
+                parallel.
             max_workers: Maximum number of worker threads for parallel processing.
-                Defaults to number of CPU cores.
+                Defaults to the number of CPUs.
             auto_chapters: If True, automatically generate chapter markers in the
                 merged output file based on segment boundaries.
             chapter_format: Format string for auto-generated chapter titles.
@@ -881,7 +894,9 @@ class ChapterExtractor:
         if not keyword and not pattern:
             raise ValueError("Either keyword or pattern must be provided")
 
-        filter_desc = pattern if pattern else keyword
+        filter_desc = (
+            pattern.pattern if isinstance(pattern, re.Pattern) else pattern or keyword
+        )
 
         results: list[ExtractionResult] = []
         output_path = Path(output_file)
@@ -891,6 +906,9 @@ class ChapterExtractor:
         file_chapters: list[tuple[Path, list[Chapter]]] = []
         total_matches = 0
 
+        if parallel:
+            self._prefetch_chapters(input_files, max_workers)
+
         for idx, input_file in enumerate(input_files):
             input_path = Path(input_file)
 
@@ -997,13 +1015,13 @@ class ChapterExtractor:
             List of segment file paths in order.
         """
         all_segments: list[Path] = []
+        result_by_path = _index_results(results)
 
         for input_path, matching in file_chapters:
             if on_progress:
                 on_progress(f"Extracting: {input_path}", 0, 0)
 
-            # Find the corresponding result to update
-            result = next(r for r in results if r.source_file == input_path)
+            result = result_by_path[input_path]
 
             try:
                 for ch_idx, chapter in enumerate(matching):
@@ -1021,6 +1039,30 @@ class ChapterExtractor:
 
         return all_segments
 
+    def _prefetch_chapters(
+        self,
+        input_files: Sequence[str | Path],
+        max_workers: int | None = None,
+    ) -> None:
+        """Probe files concurrently to fill the chapter cache.
+
+        The scan loop then reads each file's chapters from the cache in input
+        order. Failed probes are not cached, so their errors are raised and
+        reported by the scan loop as usual.
+
+        Args:
+            input_files: Files that are about to be scanned.
+            max_workers: Maximum number of concurrent ffprobe processes.
+                Defaults to the number of CPUs.
+        """
+        if len(input_files) < 2:
+            return
+
+        workers = _worker_count(max_workers, len(input_files))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for input_file in input_files:
+                executor.submit(self.get_chapters, Path(input_file))
+
     def _extract_segments_parallel(
         self,
         file_chapters: list[tuple[Path, list[Chapter]]],
@@ -1036,7 +1078,8 @@ class ChapterExtractor:
             temp_path: Temporary directory for segment files.
             results: List of ExtractionResult to update.
             on_progress: Optional progress callback.
-            max_workers: Maximum number of worker threads.
+            max_workers: Maximum number of worker threads. Defaults to the
+                number of CPUs.
 
         Returns:
             List of segment file paths in order.
@@ -1053,6 +1096,7 @@ class ChapterExtractor:
         # Results storage: segment_file indexed by global_idx
         segment_results: dict[int, Path] = {}
         extraction_errors: dict[Path, str] = {}
+        result_by_path = _index_results(results)
 
         def extract_task(
             task: tuple[int, Path, int, Chapter, Path],
@@ -1067,8 +1111,15 @@ class ChapterExtractor:
         total_tasks = len(tasks)
         completed = 0
 
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(extract_task, task): task for task in tasks}
+        # Start the longest chapters first so one long segment doesn't
+        # finish alone after the short ones; results are reordered below
+        by_duration = sorted(tasks, key=lambda t: t[3].duration, reverse=True)
+
+        workers = _worker_count(max_workers, total_tasks)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(extract_task, task): task for task in by_duration
+            }
 
             for future in as_completed(futures):
                 idx, input_path, segment_file, chapter, error = future.result()
@@ -1082,13 +1133,11 @@ class ChapterExtractor:
                     logger.error(f"Failed to extract {chapter.title}: {error}")
                 else:
                     segment_results[idx] = segment_file
-                    # Update the result
-                    result = next(r for r in results if r.source_file == input_path)
-                    result.chapters_extracted.append(chapter)
+                    result_by_path[input_path].chapters_extracted.append(chapter)
 
         # Mark failed files
         for input_path, error_msg in extraction_errors.items():
-            result = next(r for r in results if r.source_file == input_path)
+            result = result_by_path[input_path]
             result.success = False
             result.error_message = error_msg
 
@@ -1099,12 +1148,14 @@ class ChapterExtractor:
         self,
         input_files: Sequence[str | Path],
         keyword: str | None = None,
-        pattern: str | None = None,
+        pattern: str | re.Pattern[str] | None = None,
         output_dir: str | Path | None = None,
         case_sensitive: bool = False,
         exclude: bool = False,
         output_suffix: str = "_filtered",
         on_progress: Callable[[str, int, int], None] | None = None,
+        parallel: bool = False,
+        max_workers: int | None = None,
     ) -> list[ExtractionResult]:
         """Extract matching chapters from each file into separate output files.
 
@@ -1112,103 +1163,327 @@ class ChapterExtractor:
             input_files: List of input MKV file paths.
             keyword: Keyword to filter chapters by title (mutually exclusive
                 with pattern).
-            pattern: Regex pattern to match chapter titles (mutually exclusive
-                with keyword).
+            pattern: Regex pattern to match chapter titles, as a string or
+                compiled pattern (mutually exclusive with keyword).
             output_dir: Directory for output files. If None, outputs are placed
                 in the same directory as their source files.
             case_sensitive: Whether keyword/pattern matching is case-sensitive.
             exclude: If True, extract chapters that do NOT match.
             output_suffix: Suffix to append to output filenames.
-            on_progress: Optional callback for progress updates.
+            on_progress: Optional callback for progress updates. Called before
+                each file in sequential mode, and as each file finishes in
+                parallel mode.
+            parallel: If True, process input files concurrently. If a file
+                raises ChapterExtractionError, files not yet started are
+                cancelled but files already in flight run to completion.
+            max_workers: Maximum number of worker threads for parallel processing.
+                Defaults to the number of CPUs.
 
         Returns:
             List of ExtractionResult objects, one per input file.
 
         Raises:
-            ValueError: If neither keyword nor pattern is provided.
+            ValueError: If neither keyword nor pattern is provided, or if two
+                input files would write the same output file in parallel mode.
         """
         if not keyword and not pattern:
             raise ValueError("Either keyword or pattern must be provided")
 
-        results: list[ExtractionResult] = []
         output_path = Path(output_dir) if output_dir else None
 
         if output_path:
             output_path.mkdir(parents=True, exist_ok=True)
 
+        input_paths = [Path(f) for f in input_files]
+        total = len(input_paths)
+
+        if parallel:
+            # Concurrent writers to one output file would corrupt it
+            seen: dict[Path, Path] = {}
+            for input_path in input_paths:
+                out_file = _separate_output_file(input_path, output_path, output_suffix)
+                if out_file in seen:
+                    raise ValueError(
+                        f"'{seen[out_file]}' and '{input_path}' would both be "
+                        f"written to '{out_file}'"
+                    )
+                seen[out_file] = input_path
+
         with tempfile.TemporaryDirectory(dir=self._temp_dir) as temp_dir:
             temp_path = Path(temp_dir)
-            total = len(input_files)
 
-            for idx, input_file in enumerate(input_files):
-                input_path = Path(input_file)
+            def extract_file(idx: int) -> ExtractionResult:
+                # Each file gets its own scratch directory so concurrent
+                # segment and concat-list files never collide
+                file_temp = temp_path / str(idx)
+                file_temp.mkdir()
+                return self._extract_to_separate_file(
+                    input_paths[idx],
+                    file_temp,
+                    keyword,
+                    pattern,
+                    output_path,
+                    case_sensitive,
+                    exclude,
+                    output_suffix,
+                )
 
-                if on_progress:
-                    on_progress(str(input_path), idx + 1, total)
-
-                # Check if file exists
-                if not input_path.exists():
-                    logger.warning(f"File not found, skipping: {input_path}")
-                    result = ExtractionResult(
-                        source_file=input_path,
-                        success=False,
-                        error_message="File not found",
-                    )
-                    results.append(result)
-                    continue
+            if not parallel:
+                results: list[ExtractionResult] = []
+                for idx, input_path in enumerate(input_paths):
+                    if on_progress:
+                        on_progress(str(input_path), idx + 1, total)
+                    results.append(extract_file(idx))
+                return results
+
+            # Start the largest files first to shorten the straggler tail
+            by_size = sorted(
+                range(total), key=lambda i: _file_size(input_paths[i]), reverse=True
+            )
 
-                result = ExtractionResult(source_file=input_path)
+            results_by_idx: dict[int, ExtractionResult] = {}
+            workers = _worker_count(max_workers, total)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {executor.submit(extract_file, i): i for i in by_size}
 
-                try:
-                    chapters = self.get_chapters(input_path)
-                    result.chapters_found = len(chapters)
+                for completed, future in enumerate(as_completed(futures), 1):
+                    idx = futures[future]
+                    try:
+                        results_by_idx[idx] = future.result()
+                    except ChapterExtractionError:
+                        # Stop processing, matching the sequential behavior
+                        for pending in futures:
+                            pending.cancel()
+                        raise
 
-                    # Fail if file has no chapter information
-                    if len(chapters) == 0:
-                        raise ChapterExtractionError(
-                            f"No chapter information found in '{input_path.name}'"
-                        )
+                    if on_progress:
+                        on_progress(str(input_paths[idx]), completed, total)
 
-                    matching = self._filter_chapters(
-                        chapters, keyword, pattern, case_sensitive, exclude
-                    )
-                    result.chapters_matched = len(matching)
-
-                    if not matching:
-                        results.append(result)
-                        continue
-
-                    segments: list[Path] = []
-                    for ch_idx, chapter in enumerate(matching):
-                        segment_file = (
-                            temp_path / f"{input_path.stem}_segment_{ch_idx}.mkv"
-                        )
-                        self._extract_segment(input_path, chapter, segment_file)
-                        segments.append(segment_file)
-                        result.chapters_extracted.append(chapter)
-
-                    # Determine output path
-                    if output_path:
-                        out_file = output_path / f"{input_path.stem}{output_suffix}.mkv"
-                    else:
-                        out_file = (
-                            input_path.parent / f"{input_path.stem}{output_suffix}.mkv"
-                        )
-
-                    self._merge_segments(segments, out_file, temp_path)
-                    result.output_file = out_file
-
-                except ChapterExtractionError:
-                    # Re-raise ChapterExtractionError to stop processing
-                    raise
-                except Exception as e:
-                    result.success = False
-                    result.error_message = str(e)
-                    logger.error(f"Failed to process {input_path}: {e}")
+        return [results_by_idx[i] for i in range(total)]
 
-                results.append(result)
+    def _extract_to_separate_file(
+        self,
+        input_path: Path,
+        temp_path: Path,
+        keyword: str | None,
+        pattern: str | re.Pattern[str] | None,
+        output_path: Path | None,
+        case_sensitive: bool,
+        exclude: bool,
+        output_suffix: str,
+    ) -> ExtractionResult:
+        """Extract matching chapters from one file into its own output file.
 
-        return results
+        Args:
+            input_path: Path to the input file.
+            temp_path: Scratch directory for this file's segments.
+            keyword: Keyword to filter chapters by title.
+            pattern: Regex pattern to match chapter titles.
+            output_path: Output directory, or None to write next to the input.
+            case_sensitive: Whether keyword/pattern matching is case-sensitive.
+            exclude: If True, extract chapters that do NOT match.
+            output_suffix: Suffix to append to the output filename.
+
+        Returns:
+            ExtractionResult for the input file.
+
+        Raises:
+            ChapterExtractionError: If the file has no chapter information or
+                a segment cannot be extracted or merged.
+        """
+        # Check if file exists
+        if not input_path.exists():
+            logger.warning(f"File not found, skipping: {input_path}")
+            return ExtractionResult(
+                source_file=input_path,
+                success=False,
+                error_message="File not found",
+            )
+
+        result = ExtractionResult(source_file=input_path)
+
+        try:
+            chapters = self.get_chapters(input_path)
+            result.chapters_found = len(chapters)
+
+            # Fail if file has no chapter information
+            if len(chapters) == 0:
+                raise ChapterExtractionError(
+                    f"No chapter information found in '{input_path.name}'"
+                )
+
+            matching = self._filter_chapters(
+                chapters, keyword, pattern, case_sensitive, exclude
+            )
+            result.chapters_matched = len(matching)
+
+            if not matching:
+                return result
+
+            segments: list[Path] = []
+            for ch_idx, chapter in enumerate(matching):
+                segment_file = temp_path / f"{input_path.stem}_segment_{ch_idx}.mkv"
+                self._extract_segment(input_path, chapter, segment_file)
+                segments.append(segment_file)
+                result.chapters_extracted.append(chapter)
+
+            out_file = _separate_output_file(input_path, output_path, output_suffix)
+
+            self._merge_segments(segments, out_file, temp_path)
+            result.output_file = out_file
+
+        except ChapterExtractionError:
+            # Re-raise ChapterExtractionError to stop processing
+            raise
+        except Exception as e:
+            result.success = False
+            result.error_message = str(e)
+            logger.error(f"Failed to process {input_path}: {e}")
+
+        return result
+
+
+def _default_track_args(
+    tracks: list[Track], target_type: str, target_track_id: int
+) -> list[str]:
+    """Build mkvpropedit arguments that make one track the default of its type.
+
+    The default flag is first cleared on every track of the same type, then
+    set on the target track.
+    """
+    args: list[str] = []
+    for track in tracks:
+        if track.type == target_type:
+            args.extend([
+                "--edit", f"track:={track.id}",
+                "--set", "flag-default=0",
+            ])
+    args.extend([
+        "--edit", f"track:={target_track_id}",
+        "--set", "flag-default=1",
+    ])
+    return args
+
+
+def _stderr_text(error: subprocess.CalledProcessError) -> str:
+    """Decode a failed command's captured stderr for an error message.
+
+    Undecodable bytes are replaced so a stray non-UTF-8 byte in ffmpeg's
+    output can't mask the original failure with a UnicodeDecodeError.
+    """
+    stderr: bytes = error.stderr or b""
+    return stderr.decode(errors="replace")
+
+
+def _worker_count(max_workers: int | None, task_count: int) -> int:
+    """Return how many threads to start for a batch of subprocess tasks.
+
+    Each worker runs one ffmpeg/ffprobe process at a time, so this also caps
+    the number of concurrent child processes.
+
+    Args:
+        max_workers: Requested maximum, or None for the number of CPUs.
+        task_count: Number of tasks to be run.
+
+    Returns:
+        At least 1, and never more threads than there are tasks.
+    """
+    limit = max_workers or os.cpu_count() or 1
+    return max(1, min(limit, task_count))
+
+
+def _index_results(results: list[ExtractionResult]) -> dict[Path, ExtractionResult]:
+    """Map each source file to its result, keeping the first if repeated."""
+    return {r.source_file: r for r in reversed(results)}
+
+
+def _parse_chapters(data: dict[str, Any]) -> list[Chapter]:
+    """Build Chapter objects from ffprobe's JSON output."""
+    chapters = []
+    for idx, chapter_data in enumerate(data.get("chapters", [])):
+        tags = chapter_data.get("tags", {})
+        title = tags.get("title", f"Chapter {idx + 1}")
+        chapters.append(
+            Chapter(
+                title=title,
+                start_time=float(chapter_data["start_time"]),
+                end_time=float(chapter_data["end_time"]),
+                index=idx,
+            )
+        )
+    return chapters
+
+
+def _parse_tracks(data: dict[str, Any]) -> list[Track]:
+    """Build Track objects from ffprobe's JSON output."""
+    tracks = []
+    for stream in data.get("streams", []):
+        codec_type = stream.get("codec_type", "unknown")
+
+        # Map ffprobe codec_type to our track type
+        if codec_type == "video":
+            track_type = "video"
+        elif codec_type == "audio":
+            track_type = "audio"
+        elif codec_type == "subtitle":
+            track_type = "subtitles"
+        else:
+            track_type = codec_type
+
+        # Get language from tags
+        tags = stream.get("tags", {})
+        language = tags.get("language")
+        name = tags.get("title")
+
+        # Get disposition flags
+        disposition = stream.get("disposition", {})
+        is_default = disposition.get("default", 0) == 1
+        is_forced = disposition.get("forced", 0) == 1
+
+        track = Track(
+            id=stream.get("index", 0),
+            type=track_type,
+            codec=stream.get("codec_name", "unknown"),
+            language=language,
+            name=name,
+            default=is_default,
+            forced=is_forced,
+            channels=stream.get("channels") if codec_type == "audio" else None,
+            sample_rate=(
+                int(stream.get("sample_rate"))
+                if codec_type == "audio" and stream.get("sample_rate")
+                else None
+            ),
+            width=stream.get("width") if codec_type == "video" else None,
+            height=stream.get("height") if codec_type == "video" else None,
+        )
+        tracks.append(track)
+    return tracks
+
+
+def _file_size(path: Path) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be read."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _separate_output_file(
+    input_path: Path, output_dir: Path | None, output_suffix: str
+) -> Path:
+    """Return the output file for an input in separate-file mode.
+
+    Args:
+        input_path: Path to the input file.
+        output_dir: Output directory, or None to write next to the input.
+        output_suffix: Suffix to append to the output filename.
+
+    Returns:
+        Path of the output file.
+    """
+    directory = output_dir if output_dir else input_path.parent
+    return directory / f"{input_path.stem}{output_suffix}.mkv"
 
 
 def is_supported_format(file_path: str | Path) -> bool:
@@ -1271,11 +1546,83 @@ def resolve_input_files(
         )
 
     if filter_supported:
-        files = [f for f in files if is_supported_format(f)]
+        files = [f for f in files if f.suffix.lower() in SUPPORTED_FORMATS]
+
+    return files
+
+
+def resolve_input_files_many(
+    patterns: Sequence[str],
+    filter_supported: bool = True,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Resolve several glob patterns, listing each directory only once.
+
+    Patterns whose wildcards are confined to the filename (such as
+    ``videos/*.mkv`` and ``videos/*.mp4``) share a single directory
+    listing. Listings and any other patterns are expanded concurrently.
+
+    Args:
+        patterns: Glob patterns or literal file paths.
+        filter_supported: If True, only return files with supported formats.
+            Defaults to True.
+        max_workers: Maximum number of threads used to expand patterns.
+
+    Returns:
+        Resolved files, grouped in pattern order and sorted within each group.
+
+    Raises:
+        FileNotFoundError: If any pattern matches no files.
+    """
+    filename_globs: dict[str, tuple[str, str]] = {}
+    for pattern in patterns:
+        directory, name = os.path.split(pattern)
+        if _GLOB_MAGIC.search(name) and not _GLOB_MAGIC.search(directory):
+            filename_globs[pattern] = (directory, name)
+
+    directories = {directory for directory, _ in filename_globs.values()}
+    other_patterns = {p for p in patterns if p not in filename_globs}
+    workers = max_workers or max(1, len(directories) + len(other_patterns))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        listings = {d: executor.submit(_list_directory, d) for d in directories}
+        others: dict[str, Future[list[Path]]] = {
+            p: executor.submit(resolve_input_files, p, filter_supported)
+            for p in other_patterns
+        }
+
+        files: list[Path] = []
+        for pattern in patterns:
+            if pattern in others:
+                files.extend(others[pattern].result())
+                continue
+
+            directory, name = filename_globs[pattern]
+            # Like glob, wildcards don't match hidden files unless asked to
+            matched = sorted(
+                Path(os.path.join(directory, entry))
+                for entry in listings[directory].result()
+                if fnmatch(entry, name)
+                and (not entry.startswith(".") or name.startswith("."))
+            )
+            if not matched:
+                raise FileNotFoundError(f"No files found matching pattern: {pattern}")
+            if filter_supported:
+                matched = [f for f in matched if f.suffix.lower() in SUPPORTED_FORMATS]
+            files.extend(matched)
 
     return files
 
 
+def _list_directory(directory: str) -> list[str]:
+    """Return the entry names in a directory, or [] if it can't be read."""
+    try:
+        with os.scandir(directory or os.curdir) as entries:
+            return [entry.name for entry in entries]
+    except OSError:
+        return []
+
+
 def extract_chapters(
     input_pattern: str | list[str | Path],
     output_file: str | Path,
@@ -1297,6 +1644,7 @@ def extract_chapters(
         exclude: If True, extract chapters that do NOT match.
         parallel: If True, use parallel processing for extraction.
         max_workers: Maximum number of worker threads for parallel processing.
+            Defaults to the number of CPUs.
 
     Returns:
         List of ExtractionResult objects.
@@ -1330,6 +1678,8 @@ def extract_chapters_to_separate_files(
     case_sensitive: bool = False,
     exclude: bool = False,
     output_suffix: str = "_filtered",
+    parallel: bool = False,
+    max_workers: int | None = None,
 ) -> list[ExtractionResult]:
     r"""Convenience function to extract chapters to separate output files.
 
@@ -1341,6 +1691,9 @@ def extract_chapters_to_separate_files(
         case_sensitive: Whether matching is case-sensitive.
         exclude: If True, extract chapters that do NOT match.
         output_suffix: Suffix to append to output filenames.
+        parallel: If True, process input files concurrently.
+        max_workers: Maximum number of worker threads for parallel processing.
+            Defaults to the number of CPUs.
 
     Returns:
         List of ExtractionResult objects.
@@ -1362,4 +1715,6 @@ def extract_chapters_to_separate_files(
         case_sensitive=case_sensitive,
         exclude=exclude,
         output_suffix=output_suffix,
+        parallel=parallel,
+        max_workers=max_workers,
     )
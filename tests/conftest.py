@@ -0,0 +1,17 @@
+"""Shared fixtures for the test suite."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from chaptersaw.extractor import _validate_executables
+
+
+@pytest.fixture(autouse=True)
+def ffmpeg_on_path() -> Iterator[MagicMock]:
+    """Report ffmpeg and ffprobe as installed; their invocations are mocked."""
+    _validate_executables.cache_clear()
+    with patch("chaptersaw.extractor.shutil.which", side_effect=str) as mock_which:
+        yield mock_which
+    _validate_executables.cache_clear()
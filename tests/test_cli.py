@@ -5,7 +5,18 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from chaptersaw.cli import create_parser, main
+from chaptersaw.cli import (
+    RichProgressCallback,
+    create_parser,
+    format_track_details,
+    format_track_flags,
+    main,
+    probe_in_order,
+    resolve_inputs,
+    run_dry_run,
+    set_default_tracks,
+)
+from chaptersaw.models import Chapter, Track
 
 
 class TestCreateParser:
@@ -116,6 +127,15 @@ class TestMain:
             mock_class.return_value = mock_instance
             yield mock_instance
 
+    def test_main_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that --version prints the version and succeeds."""
+        from chaptersaw import __version__
+
+        with patch("chaptersaw.cli.create_parser") as mock_parser:
+            assert main(["--version"]) == 0
+        mock_parser.assert_not_called()
+        assert capsys.readouterr().out.strip() == f"chaptersaw {__version__}"
+
     def test_main_no_files_found(self, tmp_path: Path) -> None:
         """Test main returns error when no files found."""
         with patch("chaptersaw.cli.ChapterExtractor"):
@@ -148,6 +168,80 @@ class TestMain:
             )
         assert exit_code == 1
 
+    def test_main_deduplicates_overlapping_inputs(
+        self, tmp_path: Path, mock_extractor: MagicMock
+    ) -> None:
+        """Test that a file matched by several -i patterns is processed once."""
+        first = tmp_path / "b.mkv"
+        second = tmp_path / "c.mkv"
+        first.touch()
+        second.touch()
+        mock_extractor.get_chapters.return_value = []
+
+        exit_code = main(
+            [
+                "-i",
+                str(first),
+                "-i",
+                str(tmp_path / "*.mkv"),
+                "--list-chapters",
+                "--no-progress",
+            ]
+        )
+
+        assert exit_code == 0
+        probed = [c.args[0] for c in mock_extractor.get_chapters.call_args_list]
+        assert probed == [first, second]
+
+    def test_main_summary_logged_in_batches(
+        self,
+        tmp_path: Path,
+        mock_extractor: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test that the summary logs one record per outcome group."""
+        from chaptersaw.models import ExtractionResult
+
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        chapter = Chapter("Episode 1", 0.0, 10.0)
+        mock_extractor.extract_and_merge.return_value = [
+            ExtractionResult(Path("a.mkv"), chapters_extracted=[chapter]),
+            ExtractionResult(Path("b.mkv"), chapters_extracted=[chapter]),
+            ExtractionResult(Path("c.mkv"), success=False, error_message="boom"),
+        ]
+
+        with caplog.at_level("INFO", logger="chaptersaw.cli"):
+            exit_code = main(
+                [
+                    "-i",
+                    str(test_file),
+                    "-k",
+                    "Episode",
+                    "-o",
+                    "out.mkv",
+                    "--no-progress",
+                ]
+            )
+
+        assert exit_code == 1
+        summary = [r for r in caplog.records if r.message.startswith("  ")]
+        assert [r.levelname for r in summary] == ["INFO", "ERROR"]
+        assert summary[0].message.count("\n") == 1
+        assert "FAILED: c.mkv - boom" in summary[1].message
+
+    def test_main_invalid_regex(self, tmp_path: Path) -> None:
+        """Test main reports an invalid regex as a usage error."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+
+        with (
+            patch("chaptersaw.cli.ChapterExtractor"),
+            pytest.raises(SystemExit) as exc_info,
+        ):
+            main(["-i", str(test_file), "-r", "[invalid(", "-o", "out.mkv"])
+        assert exc_info.value.code == 2
+
     def test_main_output_dir_without_separate(self, tmp_path: Path) -> None:
         """Test main errors when --output-dir used without --separate."""
         test_file = tmp_path / "test.mkv"
@@ -164,3 +258,180 @@ class TestMain:
                     ]
                 )
             assert exc_info.value.code != 0
+
+
+class TestProbeInOrder:
+    """Tests for concurrent file probing."""
+
+    def test_results_follow_input_order(self) -> None:
+        """Test that probe results are yielded in input order."""
+        files = [Path(f"video{i}.mkv") for i in range(5)]
+
+        pairs = list(probe_in_order(lambda f: f.stem, files))
+
+        assert [f for f, _ in pairs] == files
+        assert [fut.result() for _, fut in pairs] == [f.stem for f in files]
+
+    def test_errors_surface_on_result(self) -> None:
+        """Test that probe errors are raised from the future."""
+        from chaptersaw.exceptions import ChapterExtractionError
+
+        def probe(path: Path) -> str:
+            raise ChapterExtractionError(f"bad file: {path}")
+
+        [(_, future)] = probe_in_order(probe, [Path("broken.mkv")])
+        with pytest.raises(ChapterExtractionError, match="broken.mkv"):
+            future.result()
+
+
+class TestResolveInputs:
+    """Tests for resolving multiple input patterns."""
+
+    def test_preserves_pattern_order(self, tmp_path: Path) -> None:
+        """Test that files are grouped in the order patterns were given."""
+        (tmp_path / "a.mkv").touch()
+        (tmp_path / "b.mp4").touch()
+
+        files = resolve_inputs([str(tmp_path / "*.mp4"), str(tmp_path / "*.mkv")])
+
+        assert [f.name for f in files] == ["b.mp4", "a.mkv"]
+
+    def test_missing_pattern_raises(self, tmp_path: Path) -> None:
+        """Test that a pattern with no matches raises FileNotFoundError."""
+        (tmp_path / "a.mkv").touch()
+
+        with pytest.raises(FileNotFoundError, match="No files found"):
+            resolve_inputs([str(tmp_path / "*.mkv"), str(tmp_path / "*.avi")])
+
+    def test_overlapping_patterns_deduplicated(self, tmp_path: Path) -> None:
+        """Test that a file matched by several patterns is returned once."""
+        (tmp_path / "a.mkv").touch()
+        (tmp_path / "b.mkv").touch()
+
+        files = resolve_inputs(
+            [str(tmp_path / "a.mkv"), str(tmp_path / "*.mkv"), str(tmp_path / "*.mkv")]
+        )
+
+        assert [f.name for f in files] == ["a.mkv", "b.mkv"]
+
+
+class TestRunDryRun:
+    """Tests for the dry-run report."""
+
+    def test_invalid_regex_reported_per_file(
+        self, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that an invalid string pattern is reported, not raised."""
+        from chaptersaw.extractor import ChapterExtractor
+
+        extractor = MagicMock()
+        extractor.get_chapters.return_value = [Chapter("Episode 1", 0.0, 10.0)]
+        extractor.filter_chapters_by_regex = (
+            ChapterExtractor.filter_chapters_by_regex.__get__(extractor)
+        )
+
+        run_dry_run(extractor, [Path("a.mkv")], None, "[invalid(", False, False)
+
+        assert "Error:" in capsys.readouterr().out
+
+    def test_report_layout(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test that each file's report is followed by a blank line."""
+        extractor = MagicMock()
+        chapter = Chapter("Episode 1", 0.0, 10.0)
+        extractor.get_chapters.return_value = [chapter]
+        extractor.filter_chapters_by_keyword.return_value = [chapter]
+
+        run_dry_run(extractor, [Path("a.mkv")], "Episode", None, False, False)
+
+        assert capsys.readouterr().out == (
+            "\n=== DRY RUN ===\n\n"
+            "File: a.mkv\n"
+            "  Total chapters: 1\n"
+            "  Matching 'Episode': 1\n"
+            f"    - {chapter}\n"
+            "\n"
+            "Total chapters to extract: 1\n"
+        )
+
+
+class TestStartup:
+    """Tests for CLI import-time behavior."""
+
+    def test_import_does_not_load_rich(self) -> None:
+        """Test that rich is only imported when output needs it."""
+        import subprocess
+        import sys
+
+        code = "import sys, chaptersaw.cli; print('rich' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestRichProgressCallback:
+    """Tests for the rich progress callback."""
+
+    def test_description_only_updated_on_change(self) -> None:
+        """Test that repeated files only advance the completed count."""
+        with patch("rich.progress.Progress") as mock_progress_class:
+            callback = RichProgressCallback(3)
+        progress = mock_progress_class.return_value
+
+        callback("a.mkv", 1, 3)
+        callback("a.mkv", 2, 3)
+        callback("b.mkv", 3, 3)
+
+        calls = progress.update.call_args_list
+        assert calls[0].kwargs["description"] == "Processing: a.mkv"
+        assert "description" not in calls[1].kwargs
+        assert calls[1].kwargs["completed"] == 2
+        assert calls[2].kwargs["description"] == "Processing: b.mkv"
+
+
+class TestSetDefaultTracks:
+    """Tests for the set-default mode."""
+
+    def test_reports_failure_and_continues(self) -> None:
+        """Test that one failing file doesn't stop the others."""
+        from chaptersaw.exceptions import UnsupportedFormatError
+
+        extractor = MagicMock()
+        extractor.set_default_track.side_effect = [
+            UnsupportedFormatError("not MKV"),
+            None,
+        ]
+
+        ok = set_default_tracks(
+            extractor,
+            [Path("a.mp4"), Path("b.mkv")],
+            audio=None,
+            subtitle=None,
+            track_id=2,
+            quiet=True,
+        )
+
+        assert ok is False
+        assert extractor.set_default_track.call_count == 2
+
+
+class TestTrackFormatting:
+    """Tests for the track listing helpers."""
+
+    def test_video_track(self) -> None:
+        """Test details for a default video track."""
+        track = Track(0, "video", "h264", width=1920, height=1080, default=True)
+        assert format_track_details(track) == "1920x1080"
+        assert format_track_flags(track) == "default"
+
+    def test_audio_track(self) -> None:
+        """Test details for a forced audio track."""
+        track = Track(1, "audio", "aac", channels=2, sample_rate=48000, forced=True)
+        assert format_track_details(track) == "2ch, 48000Hz"
+        assert format_track_flags(track) == "forced"
+
+    def test_bare_track(self) -> None:
+        """Test that a track without details or flags formats as empty."""
+        track = Track(2, "subtitles", "ass")
+        assert format_track_details(track) == ""
+        assert format_track_flags(track) == ""
@@ -1,6 +1,7 @@
 """Tests for the extractor module."""
 
 import json
+import os
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -14,8 +15,11 @@ from chaptersaw.exceptions import (
 from chaptersaw.extractor import (
     SUPPORTED_FORMATS,
     ChapterExtractor,
+    _worker_count,
+    compile_pattern,
     is_supported_format,
     resolve_input_files,
+    resolve_input_files_many,
     validate_format,
 )
 from chaptersaw.models import Chapter
@@ -36,12 +40,29 @@ class TestChapterExtractor:
         """Create an extractor instance with mocked dependencies."""
         return ChapterExtractor()
 
-    def test_init_validates_dependencies(self) -> None:
+    def test_init_validates_dependencies(self, ffmpeg_on_path: MagicMock) -> None:
         """Test that initialization validates ffmpeg/ffprobe."""
+        ffmpeg_on_path.side_effect = None
+        ffmpeg_on_path.return_value = None
+        with pytest.raises(FFmpegNotFoundError, match="ffprobe not found"):
+            ChapterExtractor()
+
+    def test_init_validation_cached_per_paths(
+        self, ffmpeg_on_path: MagicMock
+    ) -> None:
+        """Test that repeated extractors don't search PATH again."""
+        ChapterExtractor()
+        ChapterExtractor()
+        assert ffmpeg_on_path.call_count == 2
+
+        ChapterExtractor(ffmpeg_path="/custom/ffmpeg")
+        assert ffmpeg_on_path.call_count == 4
+
+    def test_init_spawns_no_processes(self) -> None:
+        """Test that dependency validation doesn't run the executables."""
         with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-            with pytest.raises(FFmpegNotFoundError):
-                ChapterExtractor()
+            ChapterExtractor()
+        mock_run.assert_not_called()
 
     def test_init_with_custom_paths(self) -> None:
         """Test initialization with custom ffmpeg paths."""
@@ -124,6 +145,214 @@ class TestChapterExtractor:
         assert len(chapters) == 1
         assert chapters[0].title == "Chapter 1"
 
+    def test_probe_failure_with_undecodable_stderr(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that non-UTF-8 stderr still yields a ChapterExtractionError."""
+        import subprocess
+
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.side_effect = subprocess.CalledProcessError(
+                1, "ffprobe", stderr=b"Invalid data \xff"
+            )
+            with pytest.raises(ChapterExtractionError, match="Invalid data"):
+                extractor.get_chapters(test_file)
+
+    def test_chapters_and_tracks_share_one_probe(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that one ffprobe run answers both chapters and tracks."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        probe_data = {
+            "chapters": [
+                {"start_time": "0.0", "end_time": "60.0", "tags": {"title": "A"}},
+            ],
+            "streams": [{"index": 0, "codec_type": "video", "codec_name": "h264"}],
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(probe_data))
+            chapters = extractor.get_chapters(test_file)
+            tracks = extractor.get_tracks(test_file)
+
+        mock_run.assert_called_once()
+        cmd = mock_run.call_args.args[0]
+        assert "-show_chapters" in cmd
+        assert "-show_streams" in cmd
+        assert [ch.title for ch in chapters] == ["A"]
+        assert [t.codec for t in tracks] == ["h264"]
+
+    def test_set_default_track_refreshes_cached_tracks(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that editing a file in place invalidates its cached tracks."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        stream_data = {
+            "streams": [
+                {"index": 1, "codec_type": "audio", "tags": {"language": "jpn"}},
+                {"index": 2, "codec_type": "audio", "tags": {"language": "eng"}},
+            ]
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(stream_data))
+            extractor.get_tracks(test_file)
+            extractor.set_default_track(test_file, track_id=2)
+            probes_before = mock_run.call_count
+            extractor.get_tracks(test_file)
+
+        # The edit itself reuses the cached tracks, the next read re-probes
+        assert probes_before == 2  # ffprobe, mkvpropedit
+        assert mock_run.call_count == 3
+
+    def test_mkvpropedit_missing(
+        self, extractor: ChapterExtractor, ffmpeg_on_path: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test that a missing mkvpropedit is reported without running it."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        ffmpeg_on_path.side_effect = None
+        ffmpeg_on_path.return_value = None
+
+        with (
+            patch("subprocess.run") as mock_run,
+            pytest.raises(ChapterExtractionError, match="mkvpropedit not found"),
+        ):
+            extractor.set_default_track(test_file, track_id=1)
+        mock_run.assert_not_called()
+
+    def test_set_default_tracks_by_language_edits_once(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that audio and subtitle defaults are set in one mkvpropedit run."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        stream_data = {
+            "streams": [
+                {"index": 1, "codec_type": "audio", "tags": {"language": "eng"}},
+                {"index": 2, "codec_type": "audio", "tags": {"language": "jpn"}},
+                {"index": 3, "codec_type": "subtitle", "tags": {"language": "eng"}},
+            ]
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(stream_data))
+            result = extractor.set_default_tracks_by_language(
+                test_file, audio_language="jpn", subtitle_language="eng"
+            )
+
+        assert result == {"audio": 2, "subtitle": 3}
+        edits = [
+            c.args[0] for c in mock_run.call_args_list if "--edit" in c.args[0]
+        ]
+        assert len(edits) == 1
+        assert edits[0][2:] == [
+            "--edit", "track:=1", "--set", "flag-default=0",
+            "--edit", "track:=2", "--set", "flag-default=0",
+            "--edit", "track:=2", "--set", "flag-default=1",
+            "--edit", "track:=3", "--set", "flag-default=0",
+            "--edit", "track:=3", "--set", "flag-default=1",
+        ]
+
+    def test_set_default_tracks_by_language_missing_track(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that an unmatched language is reported as None, not an error."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+        stream_data = {
+            "streams": [
+                {"index": 1, "codec_type": "audio", "tags": {"language": "eng"}},
+            ]
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(stream_data))
+            result = extractor.set_default_tracks_by_language(
+                test_file, audio_language="jpn"
+            )
+
+        assert result == {"audio": None, "subtitle": None}
+        assert not any("--edit" in c.args[0] for c in mock_run.call_args_list)
+
+    def test_extract_segment_quiets_ffmpeg(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that ffmpeg only reports errors and never reads stdin."""
+        with patch("subprocess.run") as mock_run:
+            extractor._extract_segment(
+                tmp_path / "in.mkv", Chapter("A", 0.0, 60.0), tmp_path / "out.mkv"
+            )
+
+        cmd = mock_run.call_args.args[0]
+        assert cmd[1:6] == ["-hide_banner", "-nostdin", "-loglevel", "error", "-i"]
+
+    def test_merge_segments_writes_absolute_concat_list(
+        self,
+        extractor: ChapterExtractor,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that relative segment paths are written as absolute paths."""
+        monkeypatch.chdir(tmp_path)
+        segments = [Path("a_segment_0.mkv"), Path("b_segment_0.mkv")]
+
+        with patch("subprocess.run"):
+            extractor._merge_segments(segments, tmp_path / "out.mkv", tmp_path)
+
+        expected = "".join(f"file '{tmp_path / s}'\n" for s in segments)
+        assert (tmp_path / "concat_list.txt").read_text(encoding="utf-8") == expected
+
+    def test_get_chapters_parses_utf8_bytes(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that ffprobe output is decoded as UTF-8 JSON, not by locale."""
+        test_file = tmp_path / "test.mkv"
+        test_file.touch()
+
+        chapter_data = {
+            "chapters": [
+                {"start_time": "0.0", "end_time": "60.0", "tags": {"title": "Épisode"}},
+            ]
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(
+                stdout=json.dumps(chapter_data, ensure_ascii=False).encode()
+            )
+            chapters = extractor.get_chapters(test_file)
+
+        assert chapters[0].title == "Épisode"
+
+    def test_get_chapters_cached_until_file_changes(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that ffprobe is only re-run when the file changes."""
+        test_file = tmp_path / "test.mkv"
+        test_file.write_bytes(b"a")
+
+        chapter_data = {
+            "chapters": [
+                {"start_time": "0.0", "end_time": "60.0", "tags": {"title": "A"}},
+            ]
+        }
+
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(stdout=json.dumps(chapter_data))
+            first = extractor.get_chapters(test_file)
+            second = extractor.get_chapters(test_file)
+            assert mock_run.call_count == 1
+            assert first == second
+
+            test_file.write_bytes(b"changed")
+            extractor.get_chapters(test_file)
+            assert mock_run.call_count == 2
+
     def test_filter_chapters_by_keyword(
         self, extractor: ChapterExtractor
     ) -> None:
@@ -168,6 +397,41 @@ class TestChapterExtractor:
         assert len(filtered) == 1
         assert filtered[0].title == "Episode 3"
 
+    def test_filter_chapters_by_keyword_exclude_keeps_duplicates(
+        self, extractor: ChapterExtractor
+    ) -> None:
+        """Test that exclude mode keeps order and repeated chapters."""
+        chapters = [
+            Chapter("Part A", 0.0, 100.0),
+            Chapter("Credits", 100.0, 120.0),
+            Chapter("Part A", 0.0, 100.0),
+        ]
+
+        filtered = extractor.filter_chapters_by_keyword(
+            chapters, "credits", exclude=True
+        )
+        assert filtered == [chapters[0], chapters[2]]
+
+    def test_filter_chapters_by_regex_precompiled(
+        self, extractor: ChapterExtractor
+    ) -> None:
+        """Test regex filtering with an already compiled pattern."""
+        chapters = [
+            Chapter("Episode 1", 0.0, 100.0),
+            Chapter("episode 2", 100.0, 200.0),
+            Chapter("Credits", 200.0, 300.0),
+        ]
+
+        compiled = compile_pattern(r"^Episode \d", case_sensitive=True)
+        filtered = extractor.filter_chapters_by_regex(chapters, compiled)
+        assert [ch.title for ch in filtered] == ["Episode 1"]
+
+    def test_compile_pattern_is_cached(self) -> None:
+        """Test that compile_pattern reuses compiled patterns."""
+        first = compile_pattern("Episode", False)
+        assert compile_pattern("Episode", False) is first
+        assert compile_pattern("Episode", True) is not first
+
     def test_filter_chapters_by_predicate(
         self, extractor: ChapterExtractor
     ) -> None:
@@ -262,6 +526,49 @@ class TestResolveInputFiles:
         assert len(files) == 2
 
 
+class TestResolveInputFilesMany:
+    """Tests for the resolve_input_files_many function."""
+
+    def test_matches_per_pattern_glob(self, tmp_path: Path) -> None:
+        """Test that results match resolving each pattern separately."""
+        for name in ["b.mkv", "a.mkv", "c.mp4", ".hidden.mkv", "notes.txt"]:
+            (tmp_path / name).touch()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "d.mkv").touch()
+
+        patterns = [
+            str(tmp_path / "*.mp4"),
+            str(tmp_path / "*.mkv"),
+            str(tmp_path / "*" / "*.mkv"),
+            str(tmp_path / "notes.txt"),
+        ]
+        expected = [
+            f for p in patterns for f in resolve_input_files(p, filter_supported=False)
+        ]
+
+        assert resolve_input_files_many(patterns, filter_supported=False) == expected
+
+    def test_lists_shared_directory_once(self, tmp_path: Path) -> None:
+        """Test that patterns in one directory share a single listing."""
+        (tmp_path / "a.mkv").touch()
+        (tmp_path / "b.mp4").touch()
+
+        with patch("chaptersaw.extractor.os.scandir", wraps=os.scandir) as mock_scandir:
+            files = resolve_input_files_many(
+                [str(tmp_path / "*.mkv"), str(tmp_path / "*.mp4")]
+            )
+
+        assert [f.name for f in files] == ["a.mkv", "b.mp4"]
+        mock_scandir.assert_called_once()
+
+    def test_no_matches_raises(self, tmp_path: Path) -> None:
+        """Test that a pattern matching nothing raises FileNotFoundError."""
+        (tmp_path / "a.mkv").touch()
+
+        with pytest.raises(FileNotFoundError, match="No files found"):
+            resolve_input_files_many([str(tmp_path / "*.mkv"), str(tmp_path / "*.avi")])
+
+
 class TestFormatSupport:
     """Tests for multi-format support utilities."""
 
@@ -320,6 +627,28 @@ class TestFormatSupport:
         assert ".mp4" in error_msg
 
 
+class TestWorkerCount:
+    """Tests for sizing parallel worker pools."""
+
+    def test_defaults_to_cpu_count(self) -> None:
+        """Test that the default is the CPU count, not cpu_count + 4."""
+        with patch("os.cpu_count", return_value=4):
+            assert _worker_count(None, 100) == 4
+
+    def test_capped_by_task_count(self) -> None:
+        """Test that no more threads are started than there are tasks."""
+        with patch("os.cpu_count", return_value=16):
+            assert _worker_count(None, 3) == 3
+        assert _worker_count(8, 2) == 2
+
+    def test_explicit_limit_and_minimum(self) -> None:
+        """Test that an explicit limit applies and at least one worker runs."""
+        assert _worker_count(2, 10) == 2
+        assert _worker_count(None, 0) == 1
+        with patch("os.cpu_count", return_value=None):
+            assert _worker_count(None, 5) == 1
+
+
 class TestGenerateMergeChapters:
     """Tests for the _generate_merge_chapters method."""
 
@@ -444,3 +773,204 @@ class TestGenerateMergeChapters:
                 assert len(written_chapters) == 2
                 assert written_chapters[0].start_time == 0.0
                 assert written_chapters[1].start_time == 1200.0
+
+
+class TestExtractToSeparateFiles:
+    """Tests for the extract_to_separate_files method."""
+
+    @pytest.fixture
+    def extractor(self) -> ChapterExtractor:
+        """Create an extractor instance with mocked dependencies."""
+        with patch("subprocess.run"):
+            return ChapterExtractor()
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_results_in_input_order(
+        self, extractor: ChapterExtractor, tmp_path: Path, parallel: bool
+    ) -> None:
+        """Test that results follow input order in both modes."""
+        inputs = [tmp_path / f"video{i}.mkv" for i in range(4)]
+        for f in inputs:
+            f.touch()
+
+        chapters = [
+            Chapter("Episode", 0.0, 100.0),
+            Chapter("Credits", 100.0, 120.0),
+        ]
+        progress = MagicMock()
+
+        with (
+            patch.object(extractor, "get_chapters", return_value=chapters),
+            patch.object(extractor, "_extract_segment"),
+            patch.object(extractor, "_merge_segments") as mock_merge,
+        ):
+            results = extractor.extract_to_separate_files(
+                inputs,
+                keyword="Episode",
+                output_dir=tmp_path / "out",
+                on_progress=progress,
+                parallel=parallel,
+                max_workers=2,
+            )
+
+        assert [r.source_file for r in results] == inputs
+        assert all(r.chapters_extracted == [chapters[0]] for r in results)
+        assert mock_merge.call_count == 4
+        assert progress.call_count == 4
+        # Each file merges from its own scratch directory
+        assert len({call.args[2] for call in mock_merge.call_args_list}) == 4
+
+    def test_parallel_starts_largest_file_first(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that parallel mode schedules files by descending size."""
+        inputs = [tmp_path / f"video{i}.mkv" for i in range(3)]
+        for f, size in zip(inputs, [10, 30, 20], strict=True):
+            f.write_bytes(b"x" * size)
+
+        with (
+            patch.object(extractor, "get_chapters", return_value=[]) as mock_get,
+            pytest.raises(ChapterExtractionError),
+        ):
+            extractor.extract_to_separate_files(
+                inputs, keyword="Episode", parallel=True, max_workers=1
+            )
+
+        assert mock_get.call_args_list[0].args[0] == inputs[1]
+
+    def test_parallel_rejects_colliding_outputs(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that parallel mode refuses to write one output twice."""
+        inputs = [tmp_path / "a" / "video.mkv", tmp_path / "b" / "video.mkv"]
+        for f in inputs:
+            f.parent.mkdir()
+            f.touch()
+
+        with (
+            patch.object(extractor, "get_chapters") as mock_get,
+            pytest.raises(ValueError, match="would both be written"),
+        ):
+            extractor.extract_to_separate_files(
+                inputs,
+                keyword="Episode",
+                output_dir=tmp_path / "out",
+                parallel=True,
+            )
+        mock_get.assert_not_called()
+
+    def test_parallel_propagates_extraction_error(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that files without chapters stop parallel processing."""
+        test_file = tmp_path / "video.mkv"
+        test_file.touch()
+
+        with (
+            patch.object(extractor, "get_chapters", return_value=[]),
+            pytest.raises(ChapterExtractionError, match="No chapter information"),
+        ):
+            extractor.extract_to_separate_files(
+                [test_file], keyword="Episode", parallel=True
+            )
+
+
+class TestExtractAndMerge:
+    """Tests for the extract_and_merge method."""
+
+    @pytest.fixture
+    def extractor(self) -> ChapterExtractor:
+        """Create an extractor instance with mocked dependencies."""
+        with patch("subprocess.run"):
+            return ChapterExtractor()
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_merge_cuts_same_segments_in_both_modes(
+        self, extractor: ChapterExtractor, tmp_path: Path, parallel: bool
+    ) -> None:
+        """Test that --parallel does not change which segments are cut."""
+        inputs = [tmp_path / "a.mkv", tmp_path / "b.mkv"]
+        for f in inputs:
+            f.touch()
+
+        chapters = [
+            Chapter("Episode", 10.0, 100.0),
+            Chapter("Credits", 100.0, 120.0),
+        ]
+
+        with (
+            patch.object(extractor, "get_chapters", return_value=chapters),
+            patch.object(extractor, "_extract_segment") as mock_segment,
+            patch.object(extractor, "_merge_segments") as mock_merge,
+        ):
+            results = extractor.extract_and_merge(
+                inputs,
+                tmp_path / "out.mkv",
+                keyword="Episode",
+                parallel=parallel,
+            )
+
+        cuts = sorted((c.args[0], c.args[1]) for c in mock_segment.call_args_list)
+        assert cuts == [(inputs[0], chapters[0]), (inputs[1], chapters[0])]
+        mock_merge.assert_called_once()
+        assert all(r.output_file == tmp_path / "out.mkv" for r in results)
+
+    def test_parallel_probes_each_file_once(
+        self, extractor: ChapterExtractor, tmp_path: Path
+    ) -> None:
+        """Test that prefetched probes are reused by the scan loop."""
+        inputs = [tmp_path / f"{name}.mkv" for name in "abc"]
+        for f in inputs:
+            f.touch()
+        chapter_data = {
+            "chapters": [
+                {"start_time": "0.0", "end_time": "60.0", "tags": {"title": "Ep"}},
+            ]
+        }
+
+        with (
+            patch("subprocess.run") as mock_run,
+            patch.object(extractor, "_extract_segment"),
+            patch.object(extractor, "_merge_segments"),
+        ):
+            mock_run.return_value = MagicMock(stdout=json.dumps(chapter_data))
+            results = extractor.extract_and_merge(
+                inputs, tmp_path / "out.mkv", keyword="Ep", parallel=True
+            )
+
+        assert mock_run.call_count == len(inputs)
+        assert [r.source_file for r in results] == inputs
+        assert all(r.chapters_matched == 1 for r in results)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_segment_failure_is_isolated_per_file(
+        self, extractor: ChapterExtractor, tmp_path: Path, parallel: bool
+    ) -> None:
+        """Test that one file failing does not stop the others merging."""
+        inputs = [tmp_path / "a.mkv", tmp_path / "b.mkv"]
+        for f in inputs:
+            f.touch()
+        chapters = [Chapter("Episode", 0.0, 100.0)]
+
+        def fake_extract(input_file: Path, chapter: Chapter, out: Path) -> None:
+            if input_file == inputs[0]:
+                raise ChapterExtractionError("ffmpeg failed")
+
+        with (
+            patch.object(extractor, "get_chapters", return_value=chapters),
+            patch.object(extractor, "_extract_segment", side_effect=fake_extract),
+            patch.object(extractor, "_merge_segments") as mock_merge,
+        ):
+            results = extractor.extract_and_merge(
+                inputs,
+                tmp_path / "out.mkv",
+                keyword="Episode",
+                parallel=parallel,
+            )
+
+        assert results[0].success is False
+        assert results[0].error_message == "ffmpeg failed"
+        assert results[0].output_file is None
+        assert results[1].success is True
+        assert results[1].output_file == tmp_path / "out.mkv"
+        assert len(mock_merge.call_args.args[0]) == 1